@@ -21,6 +21,7 @@ import re
 import argparse
 import random
 import string
+from functools import lru_cache
 
 #=====================================
 # === Borg Vocabulary and Settings ===
@@ -210,78 +211,117 @@ MONOTONE = {
     "clever": "well-adapted"
 }
 
+# All vocabulary merged into one table keyed by lowercased word. Later dicts
+# win on a clash, so I_FORMS has the final say. Values are stored lowercase;
+# preserve_case restores capitalization from the original token. Keys and
+# values are interned, so replacements shared across dicts ("cycle",
+# "expansive", ...) are one object each.
+_ALL = {
+    sys.intern(k.lower()): sys.intern(v.lower())
+    for d in (PHRASAL_VERBS, MONOTONE, VERBS, NOUNS, PRONOUNS, I_FORMS)
+    for k, v in d.items()
+}
+# Curly-apostrophe twins ("i’m") so input never needs normalizing
+_ALL.update({sys.intern(k.replace("'", "’")): v for k, v in _ALL.items() if "'" in k})
+
+def _trie_pattern(words):
+    # Regex source for a literal alternation, factored into a character trie
+    # ("b(?:e(?:come)?|ig|...)") so the engine tries only the branches that
+    # share the next character instead of every word at every position.
+    # Greedy optional tails keep longest-match-first behaviour.
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    def walk(node):
+        alts = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ''
+        body = alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+    return walk(trie)
+
+# Every vocabulary key (phrasal verbs included) as one case-insensitive
+# pattern. The lookarounds stand in for word boundaries: a hit must not touch
+# a letter, digit, apostrophe or hyphen, so "don't" and "self-test" are left alone.
+_VOCAB_RE = re.compile(
+    r"(?<![A-Za-z0-9'’\-])" + _trie_pattern(_ALL) + r"(?![A-Za-z0-9'’\-])",
+    re.IGNORECASE,
+)
+
+# One sentence per match: its text and terminator (empty for a trailing fragment)
+_SENT_RE = re.compile(r'([^.!?]+)([.!?]?)')
+
 #====================================
 # === Word Transformation Helpers ===
 #====================================
 
 def preserve_case(new, old):
-    if old.isupper():
-        return new.upper()
-    elif old.istitle() or (len(old) > 1 and old[0].isupper()):
-        return new[0].upper() + new[1:]
-    else:
+    # Lowercase first letter means lowercase output; only then is the whole
+    # word scanned to tell SHOUTING from Title case. A lone "I" counts as title.
+    if not old or not old[0].isupper():
         return new
+    if len(old) > 1 and old.isupper():
+        return new.upper()
+    return new[:1].upper() + new[1:]
 
-def pre_borgify(line):
-    for phrase, replacement in PHRASAL_VERBS.items():
-        # \b ensures whole-phrase matching, case-insensitive
-        pattern = re.compile(rf'\b{re.escape(phrase)}\b', re.IGNORECASE)
-        line = pattern.sub(replacement, line)
-    return line
-
+@lru_cache(maxsize=4096)
 def borgify_word(word):
-    # Separate word from trailing punctuation (handles most symbols)
-    match = re.match(r"^([A-Za-z0-9'’\-]+)([^\w']*)$", word)
-    if match:
-        w, punct = match.groups()
-    else:
-        w, punct = word, ""
-    wl = w.lower()
-    # Handle "I" and contractions robustly
-    if w in I_FORMS:
-        return preserve_case(I_FORMS[w], w) + punct
-    elif wl in I_FORMS:
-        return preserve_case(I_FORMS[wl], w) + punct
-    if wl in PRONOUNS:
-        return preserve_case(PRONOUNS[wl], w) + punct
-    if wl in NOUNS:
-        return preserve_case(NOUNS[wl], w) + punct
-    if wl in VERBS:
-        return preserve_case(VERBS[wl], w) + punct
-    if wl in MONOTONE:
-        return preserve_case(MONOTONE[wl], w) + punct
-    return word
+    # Unicode case-folding ("ſee") can match a key whose .lower() isn't in _ALL
+    repl = _ALL.get(word.lower())
+    if repl is None:
+        return word
+    return preserve_case(repl, word)
 
-def smart_split(line):
-    # Splits, keeping punctuation separate for transformation
-    # Handles Unicode and ASCII
-    return re.findall(r"[A-Za-z0-9'’\-]+|[^\w\s]", line)
+def assimilate_match(match):
+    # Replacement for a single _VOCAB_RE hit, case taken from the original text
+    return borgify_word(match.group(0))
 
 def borgify_line(line):
-    line = line.replace("’", "'")  # Normalize apostrophes
-    line = pre_borgify(line)       # Phrasal verb prepass
-    sentences = re.split(r'([.!?])', line)
+    line = _VOCAB_RE.sub(assimilate_match, line)  # One scan for every vocabulary hit
     output = []
-    for i in range(0, len(sentences)-1, 2):
-        sentence = sentences[i].strip()
-        punct = sentences[i+1]
+    # Local binds: the phrase roll runs once per sentence
+    rand, choice, chance = random.random, random.choice, BORG_PHRASE_CHANCE
+    for m in _SENT_RE.finditer(line):
+        sentence, punct = m.groups()
+        sentence = sentence.strip()
         if not sentence:
             continue
-        words = smart_split(sentence)
-        borged = [borgify_word(w) for w in words]
-        borgified = ' '.join(borged) + punct
-        if random.random() < BORG_PHRASE_CHANCE:
-            borgified += " < " + random.choice(BORG_PHRASES) + " >"
+        borgified = sentence + punct
+        # A trailing fragment has no terminator and never gets a phrase
+        if punct and rand() < chance:
+            borgified += " < " + choice(BORG_PHRASES) + " >"
         output.append(borgified)
-    # Handle trailing fragment if present
-    if len(sentences) % 2 == 1 and sentences[-1].strip():
-        output.append(' '.join([borgify_word(w) for w in smart_split(sentences[-1].strip())]))
     return ' '.join(output)
 
 #==========================================
 # === CLI Entrypoint and Input Handling ===
 #==========================================
 
+def assimilate_lines(lines, batch=1024):
+    # Borgify a stream of lines to stdout (skipping attribution lines),
+    # writing in batches instead of one print() per line. A terminal gets
+    # every line as soon as it's ready.
+    if sys.stdout.isatty():
+        batch = 1
+    buf = []
+    append = buf.append
+    try:
+        for line in lines:
+            line = line.rstrip()
+            if line.lstrip().startswith("-- "):
+                append(line + "\n")
+            else:
+                append(borgify_line(line) + "\n")
+            if len(buf) >= batch:
+                sys.stdout.write(''.join(buf))
+                buf.clear()
+    finally:
+        # Lines already assimilated still go out if reading fails or on Ctrl-C
+        sys.stdout.write(''.join(buf))
+
 def main():
     parser = argparse.ArgumentParser(description="Assimilate your text. < RESISTANCE IS FUTILE >")
     parser.add_argument("input", nargs="*", help="Text or filename to assimilate")
@@ -289,22 +329,14 @@ def main():
 
     # 1. If piped input, assimilate that (skipping attribution lines)
     if not sys.stdin.isatty():
-        for line in sys.stdin:
-            if line.strip().startswith("-- "):
-                print(line.rstrip())
-            else:
-                print(borgify_line(line.rstrip()))
+        assimilate_lines(sys.stdin)
         return
 
     # 2. If one arg and it's a readable file, assimilate file (skipping attribution lines)
     if len(args.input) == 1:
         try:
             with open(args.input[0], "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip().startswith("-- "):
-                        print(line.rstrip())
-                    else:
-                        print(borgify_line(line.rstrip()))
+                assimilate_lines(f)
             return
         except FileNotFoundError:
             pass  # Not a file, treat as text